@@ -9,13 +9,16 @@ Usage:
 """
 
 import datetime
+import functools
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Template variables with their defaults and descriptions
 TEMPLATE_VARS: Dict[str, Dict[str, str]] = {
@@ -77,18 +80,41 @@ TEMPLATE_VARS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# Prompt rows derived once from TEMPLATE_VARS: flat immutable
+# (name, description, prompt label, default) tuples, so collect_variables
+# does no dict lookups or label formatting inside the prompt loop.
+_PROMPT_ROWS: Tuple[Tuple[str, str, str, str], ...] = tuple(
+    (var_name, var_info["description"], f"  {var_name}", var_info["default"]) for var_name, var_info in TEMPLATE_VARS.items()
+)
+
+# Compiled once at import: replace_in_file runs over every template file, so
+# the FSM construction cost for these alternations is paid exactly once.
+_VAR_ALTERNATION = "|".join(re.escape(var_name) for var_name in TEMPLATE_VARS)
+_PLACEHOLDER_RE = re.compile(r"\{\{(" + _VAR_ALTERNATION + r")\}\}")
+_ASSIGNMENT_MARKER_RE = re.compile(
+    r"^(?P<prefix>\s*[^#\n=]+=\s*)(?P<current>[^#\n]+?)\s*#\s*TEMPLATE_VAR:"
+    r"(?P<var>" + _VAR_ALTERNATION + r")(?P<newline>\n?)$",
+    flags=re.MULTILINE,
+)
+
 # Directories to skip entirely when scanning for template files.
-SKIP_DIRS: set[str] = {
-    ".git",
-    "venv",
-    ".venv",
-    "__pycache__",
-    "node_modules",
-    ".mypy_cache",
-    ".pytest_cache",
-    "htmlcov",
-    ".tox",
-}
+SKIP_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        "venv",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        ".mypy_cache",
+        ".pytest_cache",
+        "htmlcov",
+        ".tox",
+        "build",
+        "dist",
+        ".idea",
+        ".vscode",
+    }
+)
 
 # File extensions that are definitely binary — skip without trying.
 BINARY_SUFFIXES: set[str] = {
@@ -113,8 +139,30 @@ BINARY_SUFFIXES: set[str] = {
     ".bin",
 }
 
-# Directories that may need renaming
-DIRECTORIES_TO_RENAME: List[str] = ["src", "tests"]
+# File types that may contain directory references. The empty suffix covers
+# extensionless files such as LICENSE, Dockerfile, .flake8, and .gitignore.
+TEXT_SUFFIXES: frozenset[str] = frozenset(
+    {
+        ".py",
+        ".md",
+        ".yml",
+        ".yaml",
+        ".toml",
+        ".cfg",
+        ".ini",
+        ".txt",
+        ".json",
+        ".rst",
+        ".in",
+        ".sh",
+        ".j2",
+        "",
+    }
+)
+
+# Directories that may need renaming, keyed by the template variable that
+# holds their configured name.
+DIRECTORIES_TO_RENAME: Dict[str, str] = {"src": "SOURCE_DIR", "tests": "TEST_DIR"}
 
 
 def get_input(prompt: str, default: str) -> str:
@@ -145,44 +193,92 @@ def collect_variables() -> Dict[str, str]:
 
     values: Dict[str, str] = {}
 
-    for var_name, var_info in TEMPLATE_VARS.items():
-        print(f"\n{var_info['description']}")
-        values[var_name] = get_input(f"  {var_name}", var_info["default"])
+    for var_name, description, prompt_label, default in _PROMPT_ROWS:
+        print(f"\n{description}")
+        values[var_name] = get_input(prompt_label, default)
 
     return values
 
 
-def replace_in_file(file_path: Path, replacements: Dict[str, str]) -> bool:
-    """Replace template variables in a file.
+@functools.lru_cache(maxsize=None)
+def _compile_literal_alternation(literals: tuple) -> "re.Pattern[str]":
+    """Compile an alternation of literal strings, cached per literal set."""
+    return re.compile("|".join(re.escape(literal) for literal in literals))
+
+
+def build_reference_rewrites(rename_map: Dict[str, str]) -> Dict[str, str]:
+    """Expand directory renames into the literal reference forms to rewrite.
+
+    Args:
+        rename_map: Mapping of old directory names to new names.
+
+    Returns:
+        Mapping of each literal reference form to its replacement.
+    """
+    rewrites: Dict[str, str] = {}
+    for old_name, new_name in rename_map.items():
+        rewrites[f"{old_name}/"] = f"{new_name}/"
+        # Keep the anchor: regex patterns in configs (pre-commit files:/
+        # exclude:) must stay anchored after the rename.
+        rewrites[f"^{old_name}/"] = f"^{new_name}/"
+        rewrites[f'"{old_name}"'] = f'"{new_name}"'
+        rewrites[f"'{old_name}'"] = f"'{new_name}'"
+    return rewrites
+
+
+def replace_in_file(
+    file_path: Path,
+    replacements: Dict[str, str],
+    reference_rewrites: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Replace template variables (and directory references) in a file.
 
     Args:
         file_path: Path to the file to process.
         replacements: Dictionary of variable names to values.
+        reference_rewrites: Optional mapping of literal directory-reference
+            forms to replacements, applied in the same read/write pass.
 
     Returns:
         True if file was modified, False otherwise.
     """
     try:
         content = file_path.read_text(encoding="utf-8")
-        original_content = content
-
-        for var_name, value in replacements.items():
-            pattern = "{{" + var_name + "}}"
-            content = content.replace(pattern, value)
-            assignment_pattern = (
-                r"^(?P<prefix>\s*[^#\n=]+=\s*)(?P<current>[^#\n]+?)\s*#\s*TEMPLATE_VAR:"
-                rf"{re.escape(var_name)}(?P<newline>\n?)$"
-            )
-            content = re.sub(
-                assignment_pattern,
-                lambda match: f"{match.group('prefix')}{value}{match.group('newline')}",
-                content,
-                flags=re.MULTILINE,
-            )
-
-        content = render_template_assignment_markers(content, replacements)
 
-        if content != original_content:
+        # Markers whose variable is absent from replacements are left intact.
+        # The callbacks count only real substitutions — not fallback matches
+        # returned unchanged — so deciding whether to write needs no
+        # full-buffer equality comparison afterwards.
+        placeholder_count = 0
+        assignment_count = 0
+
+        def render_placeholder(match: "re.Match[str]") -> str:
+            nonlocal placeholder_count
+            value = replacements.get(match.group(1))
+            if value is None:
+                return match.group(0)
+            placeholder_count += 1
+            return value
+
+        def render_assignment(match: "re.Match[str]") -> str:
+            nonlocal assignment_count
+            value = replacements.get(match.group("var"))
+            if value is None:
+                return match.group(0)
+            assignment_count += 1
+            return f"{match.group('prefix')}{value}{match.group('newline')}"
+
+        content = _PLACEHOLDER_RE.sub(render_placeholder, content)
+        content = _ASSIGNMENT_MARKER_RE.sub(render_assignment, content)
+
+        content, marker_count = render_template_assignment_markers(content, replacements)
+
+        reference_count = 0
+        if reference_rewrites:
+            reference_pattern = _compile_literal_alternation(tuple(reference_rewrites))
+            content, reference_count = reference_pattern.subn(lambda match: reference_rewrites[match.group(0)], content)
+
+        if placeholder_count or assignment_count or marker_count or reference_count:
             file_path.write_text(content, encoding="utf-8")
             return True
         return False
@@ -191,15 +287,22 @@ def replace_in_file(file_path: Path, replacements: Dict[str, str]) -> bool:
         return False
 
 
-def render_template_assignment_markers(content: str, replacements: Dict[str, str]) -> str:
-    """Render standalone template markers that apply to the next assignment line."""
+def render_template_assignment_markers(content: str, replacements: Dict[str, str]) -> Tuple[str, int]:
+    """Render standalone template markers that apply to the next assignment line.
+
+    Returns:
+        The rendered content and the number of assignment lines rendered.
+    """
     rendered_lines: List[str] = []
     pending_var: Optional[str] = None
+    pending_marker_line: Optional[str] = None
+    rendered_count = 0
 
     for line in content.splitlines(keepends=True):
         stripped = line.strip()
         if stripped.startswith("# TEMPLATE_VAR:"):
             pending_var = stripped.removeprefix("# TEMPLATE_VAR:").strip()
+            pending_marker_line = line
             continue
 
         if pending_var is not None:
@@ -207,14 +310,23 @@ def render_template_assignment_markers(content: str, replacements: Dict[str, str
             assignment = re.match(r"(?P<prefix>\s*[^#\n=]+=\s*)(?P<current>.*?)(?P<newline>\n?)$", line)
             if assignment is not None and value is not None:
                 rendered_lines.append(f"{assignment.group('prefix')}{value}{assignment.group('newline')}")
+                rendered_count += 1
             else:
+                # Nothing was rendered, so keep the marker line: it must not
+                # disappear just because unrelated edits trigger a write.
+                if pending_marker_line is not None:
+                    rendered_lines.append(pending_marker_line)
                 rendered_lines.append(line)
             pending_var = None
+            pending_marker_line = None
             continue
 
         rendered_lines.append(line)
 
-    return "".join(rendered_lines)
+    if pending_marker_line is not None:
+        rendered_lines.append(pending_marker_line)
+
+    return "".join(rendered_lines), rendered_count
 
 
 def iter_all_template_files(project_root: Path, skip_self: Path) -> Iterator[Path]:
@@ -224,19 +336,22 @@ def iter_all_template_files(project_root: Path, skip_self: Path) -> Iterator[Pat
     file is yielded and processed by replace_in_file, which gracefully ignores
     files that cannot be decoded as UTF-8 or contain no template variables.
     This avoids the fragile manually-maintained FILES_TO_PROCESS list.
+
+    Uses os.walk (scandir-backed) so file-vs-directory type comes from the
+    directory read itself instead of a stat() call per tree entry, and
+    ignored directories are pruned without being descended into.
     """
-    for file_path in sorted(project_root.rglob("*")):
-        if not file_path.is_file():
-            continue
-        if file_path.resolve() == skip_self.resolve():
-            continue
-        rel = file_path.relative_to(project_root)
-        # Skip files inside ignored directories (check all parent parts).
-        if any(part in SKIP_DIRS for part in rel.parts[:-1]):
-            continue
-        if file_path.suffix.lower() in BINARY_SUFFIXES:
-            continue
-        yield file_path
+    skip_self_resolved = skip_self.resolve()
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = sorted(dirname for dirname in dirnames if dirname not in SKIP_DIRS)
+        for filename in sorted(filenames):
+            file_path = Path(dirpath) / filename
+            if file_path.suffix.lower() in BINARY_SUFFIXES:
+                continue
+            # Only pay for resolve() when the basename could be the script.
+            if filename == skip_self.name and file_path.resolve() == skip_self_resolved:
+                continue
+            yield file_path
 
 
 def check_remaining_placeholders(project_root: Path, skip_self: Path) -> List[str]:
@@ -281,38 +396,92 @@ def rename_directory(project_root: Path, old_name: str, new_name: str) -> Option
     return None
 
 
-def update_file_references(project_root: Path, old_name: str, new_name: str) -> None:
+def _rewrite_references_in_file(
+    file_path: Path,
+    reference_pattern: "re.Pattern[str]",
+    rewrites: Dict[str, str],
+    old_tokens: Tuple[bytes, ...],
+) -> None:
+    """Stream directory-reference rewrites through an atomic temp-file swap.
+
+    Args:
+        file_path: Path to the file to rewrite.
+        reference_pattern: Compiled alternation of the literal rewrite forms.
+        rewrites: Mapping of each literal reference form to its replacement.
+        old_tokens: Encoded old directory names used for the cheap pre-check.
+    """
+    temp_path: Optional[str] = None
+    try:
+        # Cheap bytes-level containment check, streamed per line: every
+        # rewrite form contains an old name, so files that never mention
+        # one skip the decode and rewrite entirely.
+        with open(file_path, "rb") as source:
+            if not any(any(token in line for token in old_tokens) for line in source):
+                return
+        # Stream the rewrite through a sibling temp file so memory stays
+        # O(line length) and the swap via os.replace is atomic.
+        changed = 0
+        with open(file_path, encoding="utf-8") as source:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=file_path.parent,
+                prefix=f"{file_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as destination:
+                temp_path = destination.name
+                for line in source:
+                    new_line, count = reference_pattern.subn(lambda match: rewrites[match.group(0)], line)
+                    changed += count
+                    destination.write(new_line)
+        # The containment pre-check is broader than the rewrite forms
+        # (e.g. "testsuite" contains "tests"), so only swap when something
+        # was actually substituted.
+        if changed:
+            shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        else:
+            os.unlink(temp_path)
+    except (UnicodeDecodeError, PermissionError):
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+def update_file_references(project_root: Path, rename_map: Dict[str, str]) -> None:
     """Update references to renamed directories in files.
 
+    Handles all renames in a single tree traversal, with one read and at
+    most one write per file regardless of how many directories changed.
+
     Args:
         project_root: Root directory of the project.
-        old_name: Old directory name.
-        new_name: New directory name.
+        rename_map: Mapping of old directory names to new names.
     """
-    if old_name == new_name:
+    rename_map = {old_name: new_name for old_name, new_name in rename_map.items() if old_name != new_name}
+    if not rename_map:
         return
 
-    # Update file paths in the FILES_TO_PROCESS list pattern
-    patterns = [
-        (f"{old_name}/", f"{new_name}/"),
-        (f"^{old_name}/", f"{new_name}/"),
-        (f'"{old_name}"', f'"{new_name}"'),
-        (f"'{old_name}'", f"'{new_name}'"),
-    ]
-
-    for file_path in project_root.rglob("*"):
-        if file_path.is_file() and not file_path.name.startswith("."):
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                modified = False
-                for old_pattern, new_pattern in patterns:
-                    if old_pattern in content:
-                        content = content.replace(old_pattern, new_pattern)
-                        modified = True
-                if modified:
-                    file_path.write_text(content, encoding="utf-8")
-            except (UnicodeDecodeError, PermissionError):
-                pass
+    patterns = build_reference_rewrites(rename_map)
+    reference_pattern = _compile_literal_alternation(tuple(patterns))
+    old_tokens = tuple(old_name.encode("utf-8") for old_name in rename_map)
+
+    # Walk with os.walk so whole subtrees (.git, virtualenvs, caches) are
+    # pruned at the directory level instead of read-and-discarded per file.
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = [dirname for dirname in dirnames if dirname not in SKIP_DIRS]
+        for filename in filenames:
+            # Gate on suffix before reading rather than relying on decode
+            # errors to filter binaries after a full read.
+            if Path(filename).suffix.lower() not in TEXT_SUFFIXES:
+                continue
+            file_path = Path(dirpath) / filename
+            # Skip symlinks: os.replace would turn the link into a regular
+            # file while leaving its target unrewritten. The target itself
+            # is rewritten when the walk reaches it.
+            if file_path.is_symlink():
+                continue
+            _rewrite_references_in_file(file_path, reference_pattern, patterns, old_tokens)
 
 
 def render_template_path(path: Path, replacements: Dict[str, str]) -> Path:
@@ -490,27 +659,46 @@ def main() -> int:  # noqa: C901 - setup flow is intentionally linear and prompt
     print("Applying configuration...")
     print("=" * 60)
 
-    # Process all template files by walking the full project tree.
+    # Rename directories first so the file pass below can apply template
+    # variables and directory references in a single read/write per file,
+    # instead of re-reading the whole tree after the renames.
+    rename_map: Dict[str, str] = {}
+    for old_name, var_name in DIRECTORIES_TO_RENAME.items():
+        new_name = values[var_name]
+        if new_name != old_name and rename_directory(project_root, old_name, new_name):
+            print(f"  Renamed: {old_name} -> {new_name}")
+            rename_map[old_name] = new_name
+
+    reference_rewrites = build_reference_rewrites(rename_map)
+
+    # Process all template files by walking the full project tree. Files are
+    # independent and the work is read/write syscall bound, so a small thread
+    # pool overlaps the I/O latency across files. Deduplicate by resolved
+    # real path first: CLAUDE.md is a symlink to AGENTS.md, and handing both
+    # to the pool would race two truncating writers on the same inode.
     modified_count = 0
     script_path = Path(__file__)
+    template_files: List[Path] = []
+    seen_real_paths = set()
     for file_path in iter_all_template_files(project_root, script_path):
-        if replace_in_file(file_path, values):
-            print(f"  Updated: {file_path.relative_to(project_root)}")
-            modified_count += 1
+        real_path = file_path.resolve()
+        if real_path in seen_real_paths:
+            continue
+        seen_real_paths.add(real_path)
+        template_files.append(file_path)
+    if template_files:
+        with ThreadPoolExecutor(max_workers=min(8, len(template_files))) as executor:
+            results = executor.map(
+                lambda file_path: (file_path, replace_in_file(file_path, values, reference_rewrites)),
+                template_files,
+            )
+            for file_path, modified in results:
+                if modified:
+                    print(f"  Updated: {file_path.relative_to(project_root)}")
+                    modified_count += 1
 
     print(f"\n  Modified {modified_count} files")
 
-    # Rename directories if needed
-    if values["SOURCE_DIR"] != "src":
-        if rename_directory(project_root, "src", values["SOURCE_DIR"]):
-            print(f"  Renamed: src -> {values['SOURCE_DIR']}")
-            update_file_references(project_root, "src", values["SOURCE_DIR"])
-
-    if values["TEST_DIR"] != "tests":
-        if rename_directory(project_root, "tests", values["TEST_DIR"]):
-            print(f"  Renamed: tests -> {values['TEST_DIR']}")
-            update_file_references(project_root, "tests", values["TEST_DIR"])
-
     renamed_template_paths = rename_template_paths(project_root, values)
     if renamed_template_paths:
         print(f"  Rendered {renamed_template_paths} template path(s)")
@@ -25,7 +25,7 @@ def test_render_template_path_replaces_ai_skill_placeholders() -> None:
     assert rendered == Path("ai-skills/gentle-site-visitor-feature-delivery/skill.yaml")
 
 
-def test_iter_additional_template_files_discovers_ai_skill_text_files(tmp_path: Path) -> None:
+def test_iter_all_template_files_discovers_ai_skill_text_files(tmp_path: Path) -> None:
     skill_dir = tmp_path / "ai-skills" / "{{PROJECT_NAME}}-feature-delivery"
     skill_dir.mkdir(parents=True)
     skill_file = skill_dir / "skill.yaml"
@@ -35,7 +35,10 @@ def test_iter_additional_template_files_discovers_ai_skill_text_files(tmp_path:
     instruction_file.write_text("# {{PROJECT_NAME}} Feature Delivery", encoding="utf-8")
     binary_file.write_bytes(b"not a template text file")
 
-    discovered = {file_path.relative_to(tmp_path) for file_path in setup_template.iter_additional_template_files(tmp_path)}
+    discovered = {
+        file_path.relative_to(tmp_path)
+        for file_path in setup_template.iter_all_template_files(tmp_path, tmp_path / "setup_template.py")
+    }
 
     assert Path("ai-skills/{{PROJECT_NAME}}-feature-delivery/skill.yaml") in discovered
     assert Path("ai-skills/{{PROJECT_NAME}}-feature-delivery/instructions.md") in discovered
@@ -57,6 +60,45 @@ def test_rename_template_paths_renders_ai_skill_directories(tmp_path: Path) -> N
     assert not skill_dir.exists()
 
 
+def test_update_file_references_applies_all_renames_in_one_pass(tmp_path: Path) -> None:
+    workflow = tmp_path / "ci.yml"
+    workflow.write_text('run: pytest tests/\nsource = "src"\nother: keep\n', encoding="utf-8")
+    untouched = tmp_path / "notes.md"
+    untouched.write_text("no directory references here\n", encoding="utf-8")
+
+    setup_template.update_file_references(tmp_path, {"src": "app", "tests": "specs"})
+
+    assert workflow.read_text(encoding="utf-8") == 'run: pytest specs/\nsource = "app"\nother: keep\n'
+    assert untouched.read_text(encoding="utf-8") == "no directory references here\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["ci.yml", "notes.md"]
+
+
+def test_update_file_references_skips_symlinks_and_unmatched_files(tmp_path: Path) -> None:
+    target = tmp_path / "AGENTS.md"
+    target.write_text("run tests/ here\n", encoding="utf-8")
+    link = tmp_path / "CLAUDE.md"
+    link.symlink_to("AGENTS.md")
+    unmatched = tmp_path / "notes.md"
+    unmatched.write_text("the testsuite is green\n", encoding="utf-8")
+    unmatched_inode = unmatched.stat().st_ino
+
+    setup_template.update_file_references(tmp_path, {"tests": "specs"})
+
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "run specs/ here\n"
+    assert unmatched.read_text(encoding="utf-8") == "the testsuite is green\n"
+    assert unmatched.stat().st_ino == unmatched_inode
+
+
+def test_update_file_references_preserves_regex_anchors(tmp_path: Path) -> None:
+    config = tmp_path / "pre-commit-config.yaml"
+    config.write_text("files: ^src/\nexclude: ^tests/fixtures/\n", encoding="utf-8")
+
+    setup_template.update_file_references(tmp_path, {"src": "app", "tests": "specs"})
+
+    assert config.read_text(encoding="utf-8") == "files: ^app/\nexclude: ^specs/fixtures/\n"
+
+
 def test_ensure_claude_symlink_recreates_expected_symlink(tmp_path: Path) -> None:
     (tmp_path / "AGENTS.md").write_text("agent guidance", encoding="utf-8")
     (tmp_path / "CLAUDE.md").write_text("stale file", encoding="utf-8")
@@ -82,6 +124,30 @@ def test_replace_in_file_renders_template_var_marker_values(tmp_path: Path) -> N
     assert config_file.read_text(encoding="utf-8") == "[tool.black]\nline-length = 99\n"
 
 
+def test_replace_in_file_keeps_unrendered_markers_on_unrelated_edits(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(
+        "name = {{PROJECT_NAME}}\n# TEMPLATE_VAR:MAIN_BRANCH\nbranch = main\n",
+        encoding="utf-8",
+    )
+
+    replaced = setup_template.replace_in_file(config_file, {"PROJECT_NAME": "demo"})
+
+    assert replaced is True
+    assert config_file.read_text(encoding="utf-8") == "name = demo\n# TEMPLATE_VAR:MAIN_BRANCH\nbranch = main\n"
+
+
+def test_replace_in_file_returns_false_for_partial_replacements_without_matches(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.ini"
+    original = "name = {{PROJECT_NAME}}\n# TEMPLATE_VAR:MAIN_BRANCH\nbranch = main\n"
+    config_file.write_text(original, encoding="utf-8")
+
+    replaced = setup_template.replace_in_file(config_file, {"DEV_BRANCH": "develop"})
+
+    assert replaced is False
+    assert config_file.read_text(encoding="utf-8") == original
+
+
 def test_replace_in_file_renders_standalone_template_var_markers(tmp_path: Path) -> None:
     config_file = tmp_path / ".flake8"
     config_file.write_text(